@@ -1,10 +1,7 @@
 # app.py
 import streamlit as st
 import pandas as pd
-import numpy as np
-import re
-from collections import Counter
-import math
+from similarity import preprocess_text, categorize_diseases, SymptomIndex
 
 # Set page config
 st.set_page_config(
@@ -65,106 +62,85 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# Text preprocessing function
-def preprocess_text(text):
-    if pd.isna(text):
-        return ""
-    text = str(text).lower()
-    text = re.sub(r'[^a-zA-Z\s]', ' ', text)  # Remove special characters
-    words = text.split()
-    # Common stop words
-    stop_words = {'the', 'and', 'or', 'but', 'is', 'in', 'it', 'to', 'of', 'for', 
-                 'with', 'on', 'at', 'by', 'an', 'a', 'this', 'that', 'are', 'was',
-                 'has', 'have', 'had', 'be', 'been', 'being'}
-    words = [word for word in words if word not in stop_words and len(word) > 2]
-    return ' '.join(words)
-
-# Disease categorization
-def categorize_disease(disease_name):
-    disease_name = disease_name.lower()
-    categories = {
-        'Cancer': ['cancer', 'carcinoma', 'tumor', 'lymphoma', 'leukemia', 'melanoma'],
-        'Infection': ['infection', 'itis', 'abscess', 'fever', 'pox', 'flu', 'sepsis'],
-        'Syndrome': ['syndrome', 'disorder'],
-        'Deficiency': ['deficiency', 'anemia', 'avitaminosis'],
-        'Poisoning': ['poisoning', 'overdose', 'intoxication', 'toxicity'],
-        'Injury': ['fracture', 'injury', 'dislocation', 'sprain', 'trauma', 'wound'],
-        'Eye Condition': ['glaucoma', 'cataract', 'vision', 'eye', 'retina', 'cornea'],
-        'Cardiovascular': ['heart', 'cardio', 'hypertension', 'blood pressure', 'artery', 'vein'],
-        'Endocrine': ['diabetes', 'thyroid', 'hormone', 'metabolic', 'gland'],
-        'Neurological': ['neuro', 'brain', 'nerve', 'neural', 'cephal', 'psych'],
-        'Respiratory': ['lung', 'pulmonary', 'breath', 'respiratory', 'asthma'],
-        'Gastrointestinal': ['gastro', 'stomach', 'intestinal', 'colon', 'liver', 'pancreas'],
-        'Pain Condition': ['arthritis', 'pain', 'ache', 'neuralgia', 'migraine']
-    }
-    
-    for category, keywords in categories.items():
-        if any(keyword in disease_name for keyword in keywords):
-            return category
-    return 'Other'
-
-# Similarity calculation
-def calculate_similarity(text1, text2):
-    words1 = text1.split()
-    words2 = text2.split()
-    
-    if not words1 or not words2:
-        return 0.0
-    
-    count1 = Counter(words1)
-    count2 = Counter(words2)
-    
-    all_words = set(words1 + words2)
-    
-    dot_product = 0
-    mag1 = 0
-    mag2 = 0
-    
-    for word in all_words:
-        dot_product += count1[word] * count2[word]
-        mag1 += count1[word] ** 2
-        mag2 += count2[word] ** 2
-    
-    if mag1 == 0 or mag2 == 0:
-        return 0.0
-    
-    return dot_product / (math.sqrt(mag1) * math.sqrt(mag2))
-
 # Load data with caching
-@st.cache_data
+@st.cache_data(show_spinner=False)
 def load_data():
     """Load the disease data from CSV"""
     try:
-        df = pd.read_csv('Diseases_Symptoms.csv')
+        text_columns = ['Name', 'Symptoms', 'Treatments']
+        df = pd.read_csv(
+            'Diseases_Symptoms.csv',
+            usecols=text_columns,
+            dtype={column: 'string[pyarrow]' for column in text_columns},
+            engine='pyarrow'
+        )
+        df[text_columns] = df[text_columns].fillna('')
+        # Precompute per-disease features once instead of on every query
+        df['_clean_symptoms'] = df['Symptoms'].map(preprocess_text)
+        df['_name_lc'] = df['Name'].str.lower()
+        df['_category'] = categorize_diseases(df['Name'])
         st.success("✅ Disease database loaded successfully!")
         return df
     except FileNotFoundError:
         st.error("❌ CSV file not found. Please make sure 'Diseases_Symptoms.csv' is in the same directory.")
         return pd.DataFrame()
 
+# Build the symptom index once; only the bundled CSV is loaded, so the
+# DataFrame is not hashed (leading underscore) on every query
+@st.cache_resource
+def build_index(_df):
+    """Build the TF-IDF and inverted index over the disease symptoms"""
+    return SymptomIndex(_df)
+
+# Most frequent words across the symptom descriptions
+@st.cache_data(show_spinner=False)
+def top_symptom_words(symptoms, k=10, min_len=5):
+    words = symptoms.astype(str).str.lower().str.split().explode()
+    words = words[words.str.len() >= min_len]
+    return words.value_counts().head(k)
+
 # Find similar diseases
 def find_similar_diseases(symptoms, df, top_n=10):
-    cleaned_symptoms = preprocess_text(symptoms)
-    
-    if not cleaned_symptoms:
-        return []
-    
-    results = []
-    for _, row in df.iterrows():
-        disease_symptoms = preprocess_text(row['Symptoms'])
-        similarity = calculate_similarity(cleaned_symptoms, disease_symptoms)
-        
-        if similarity > 0.1:  # Only include meaningful matches
-            results.append({
-                'disease': row['Name'],
-                'symptoms': row['Symptoms'],
-                'treatments': row['Treatments'],
-                'similarity': similarity,
-                'category': categorize_disease(row['Name'])
-            })
-    
-    results.sort(key=lambda x: x['similarity'], reverse=True)
-    return results[:top_n]
+    return build_index(df).query(symptoms, top_n)
+
+# Symptom input and results; reruns on its own when the user clicks Analyze
+@st.fragment
+def analysis_panel(df):
+    # Symptoms input
+    symptoms_input = st.text_area(
+        "**Describe your symptoms:**",
+        height=120,
+        placeholder="Enter symptoms separated by commas (e.g., headache, fever, fatigue, cough...)",
+        value=st.session_state.get('symptoms_input', ''),
+        help="Be as specific as possible for better results"
+    )
+    
+    # Analyze button
+    if st.button("🔍 Analyze Symptoms", type="primary", use_container_width=True):
+        if not symptoms_input.strip():
+            st.error("⚠️ Please enter some symptoms to analyze")
+        else:
+            with st.spinner("🔬 Analyzing symptoms and searching database..."):
+                results = find_similar_diseases(symptoms_input, df)
+            
+            if not results:
+                st.warning("❌ No significant matches found. Try different symptoms or be more specific.")
+            else:
+                st.success(f"✅ Found {len(results)} potential matches")
+                
+                # Display results
+                for i, disease in enumerate(results, 1):
+                    with st.container():
+                        st.markdown(f"""
+                        <div class="disease-card">
+                            <h3>{i}. {disease['disease']} 
+                            <span class="similarity-badge">{disease['similarity']*100:.1f}% match</span>
+                            </h3>
+                            <p><strong>📋 Category:</strong> <span class="category-badge">{disease['category']}</span></p>
+                            <p><strong>🧬 Symptoms:</strong> {disease['symptoms']}</p>
+                            <p><strong>💊 Treatments:</strong> {disease['treatments']}</p>
+                        </div>
+                        """, unsafe_allow_html=True)
 
 # Main application
 def main():
@@ -182,9 +158,8 @@ def main():
         st.metric("Total Diseases", len(df))
         
         # Category distribution
-        df['Category'] = df['Name'].apply(categorize_disease)
         st.write("**Category Distribution:**")
-        for category, count in df['Category'].value_counts().items():
+        for category, count in df['_category'].value_counts().items():
             st.write(f"• {category}: {count}")
         
         st.header("💡 Example Symptoms")
@@ -204,41 +179,7 @@ def main():
     col1, col2 = st.columns([3, 1])
     
     with col1:
-        # Symptoms input
-        symptoms_input = st.text_area(
-            "**Describe your symptoms:**",
-            height=120,
-            placeholder="Enter symptoms separated by commas (e.g., headache, fever, fatigue, cough...)",
-            value=st.session_state.get('symptoms_input', ''),
-            help="Be as specific as possible for better results"
-        )
-        
-        # Analyze button
-        if st.button("🔍 Analyze Symptoms", type="primary", use_container_width=True):
-            if not symptoms_input.strip():
-                st.error("⚠️ Please enter some symptoms to analyze")
-            else:
-                with st.spinner("🔬 Analyzing symptoms and searching database..."):
-                    results = find_similar_diseases(symptoms_input, df)
-                
-                if not results:
-                    st.warning("❌ No significant matches found. Try different symptoms or be more specific.")
-                else:
-                    st.success(f"✅ Found {len(results)} potential matches")
-                    
-                    # Display results
-                    for i, disease in enumerate(results, 1):
-                        with st.container():
-                            st.markdown(f"""
-                            <div class="disease-card">
-                                <h3>{i}. {disease['disease']} 
-                                <span class="similarity-badge">{disease['similarity']*100:.1f}% match</span>
-                                </h3>
-                                <p><strong>📋 Category:</strong> <span class="category-badge">{disease['category']}</span></p>
-                                <p><strong>🧬 Symptoms:</strong> {disease['symptoms']}</p>
-                                <p><strong>💊 Treatments:</strong> {disease['treatments']}</p>
-                            </div>
-                            """, unsafe_allow_html=True)
+        analysis_panel(df)
     
     with col2:
         st.header("ℹ️ About")
@@ -249,11 +190,7 @@ def main():
         
         st.header("📈 Top Symptoms")
         # Analyze common symptoms in database
-        all_symptoms = ' '.join(df['Symptoms'].astype(str)).lower()
-        words = [word for word in all_symptoms.split() if len(word) > 4]
-        common_words = Counter(words).most_common(10)
-        
-        for word, count in common_words:
+        for word, count in top_symptom_words(df['Symptoms']).items():
             st.write(f"• {word}: {count}")
     
     # Data exploration section
@@ -263,8 +200,8 @@ def main():
         # Search functionality
         search_term = st.text_input("Search diseases:", placeholder="Enter disease name...")
         if search_term:
-            filtered_df = df[df['Name'].str.contains(search_term, case=False)]
-            st.dataframe(filtered_df, use_container_width=True)
+            mask = df['_name_lc'].str.contains(search_term.lower(), regex=False, na=False)
+            st.dataframe(df.loc[mask, ['Name', 'Symptoms', 'Treatments']], use_container_width=True)
     
     
    
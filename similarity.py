@@ -0,0 +1,119 @@
+# similarity.py
+import pandas as pd
+import numpy as np
+import re
+from collections import Counter, defaultdict
+from functools import lru_cache
+import math
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+# Common stop words
+STOP_WORDS = frozenset({'the', 'and', 'or', 'but', 'is', 'in', 'it', 'to', 'of', 'for',
+                        'with', 'on', 'at', 'by', 'an', 'a', 'this', 'that', 'are', 'was',
+                        'has', 'have', 'had', 'be', 'been', 'being'})
+# Words of three or more letters; anything else separates tokens
+TOKEN_RE = re.compile(r'[a-z]{3,}')
+
+# Text preprocessing function; callers pass str (missing values are filled at load time)
+@lru_cache(maxsize=4096)
+def preprocess_text(text):
+    return ' '.join(word for word in TOKEN_RE.findall(text.lower()) if word not in STOP_WORDS)
+
+# Disease categories and the name keywords that identify them
+CATEGORIES = {
+    'Cancer': ['cancer', 'carcinoma', 'tumor', 'lymphoma', 'leukemia', 'melanoma'],
+    'Infection': ['infection', 'itis', 'abscess', 'fever', 'pox', 'flu', 'sepsis'],
+    'Syndrome': ['syndrome', 'disorder'],
+    'Deficiency': ['deficiency', 'anemia', 'avitaminosis'],
+    'Poisoning': ['poisoning', 'overdose', 'intoxication', 'toxicity'],
+    'Injury': ['fracture', 'injury', 'dislocation', 'sprain', 'trauma', 'wound'],
+    'Eye Condition': ['glaucoma', 'cataract', 'vision', 'eye', 'retina', 'cornea'],
+    'Cardiovascular': ['heart', 'cardio', 'hypertension', 'blood pressure', 'artery', 'vein'],
+    'Endocrine': ['diabetes', 'thyroid', 'hormone', 'metabolic', 'gland'],
+    'Neurological': ['neuro', 'brain', 'nerve', 'neural', 'cephal', 'psych'],
+    'Respiratory': ['lung', 'pulmonary', 'breath', 'respiratory', 'asthma'],
+    'Gastrointestinal': ['gastro', 'stomach', 'intestinal', 'colon', 'liver', 'pancreas'],
+    'Pain Condition': ['arthritis', 'pain', 'ache', 'neuralgia', 'migraine']
+}
+# One alternation per category, checked in order so the first matching category wins
+CATEGORY_PATTERNS = [(category, '|'.join(map(re.escape, keywords)))
+                     for category, keywords in CATEGORIES.items()]
+
+# Disease categorization
+def categorize_diseases(names):
+    names = names.str.lower()
+    categories = pd.Series('Other', index=names.index)
+    for category, pattern in CATEGORY_PATTERNS:
+        mask = (categories == 'Other') & names.str.contains(pattern, regex=True, na=False)
+        categories[mask] = category
+    return categories
+
+# Similarity calculation
+def calculate_similarity(text1, text2):
+    count1 = Counter(text1.split())
+    count2 = Counter(text2.split())
+    
+    if not count1 or not count2:
+        return 0.0
+    
+    # Only words present in both texts contribute to the dot product
+    dot_product = sum(count * count2[word] for word, count in count1.items() if word in count2)
+    mag1 = sum(count * count for count in count1.values())
+    mag2 = sum(count * count for count in count2.values())
+    
+    return dot_product / math.sqrt(mag1 * mag2)
+
+# Symptom index
+class SymptomIndex:
+    """TF-IDF matrix and inverted index over the preprocessed disease symptoms"""
+
+    def __init__(self, df):
+        self.vectorizer = TfidfVectorizer(token_pattern=r'[a-z]{3,}')
+        # Rows are L2-normalized by the vectorizer, so a dot product is the cosine similarity
+        self.matrix = self.vectorizer.fit_transform(df['_clean_symptoms'])
+        
+        # Inverted index: token -> positions of the diseases that mention it
+        inverted_index = defaultdict(list)
+        for i, text in enumerate(df['_clean_symptoms']):
+            for token in set(text.split()):
+                inverted_index[token].append(i)
+        self.inverted_index = {token: np.asarray(ids, dtype=np.int32) for token, ids in inverted_index.items()}
+        
+        self.names = df['Name'].to_numpy()
+        self.symptoms = df['Symptoms'].to_numpy()
+        self.treatments = df['Treatments'].to_numpy()
+        self.categories = df['_category'].to_numpy()
+
+    def query(self, symptoms, top_n=10):
+        """Return the top_n diseases most similar to the given symptoms"""
+        cleaned_symptoms = preprocess_text(symptoms)
+        
+        # Only diseases sharing at least one token with the query can score above zero
+        hits = [self.inverted_index[token] for token in set(cleaned_symptoms.split())
+                if token in self.inverted_index]
+        if not hits:
+            return []
+        candidates = np.unique(np.concatenate(hits))
+        
+        # Dense query vector so scoring is a sparse matrix-vector product
+        query = self.vectorizer.transform([cleaned_symptoms]).toarray().ravel()
+        similarities = self.matrix[candidates] @ query
+        # Rank by score, breaking ties by row position so equal scores keep CSV order
+        order = np.lexsort((candidates, -similarities))[:top_n]
+        rows = candidates[order]
+        
+        results = []
+        for name, disease_symptoms, treatments, category, similarity in zip(
+                self.names[rows], self.symptoms[rows], self.treatments[rows],
+                self.categories[rows], similarities[order]):
+            
+            if similarity > 0.1:  # Only include meaningful matches
+                results.append({
+                    'disease': name,
+                    'symptoms': disease_symptoms,
+                    'treatments': treatments,
+                    'similarity': similarity,
+                    'category': category
+                })
+        
+        return results